@@ -0,0 +1,86 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def compute_metrics(pts, fgm, fga, ftm, fta, oreb, dreb, ast, stl, blk, tov, pf, plus_minus, minutes):
+    """
+    Compute per-game advanced metrics from raw box score columns.
+
+    All metrics are produced in one fused loop over the games. Inputs must be
+    float ndarrays of equal length with NaN values already filled; outputs
+    use the same dtype as the inputs (float32 in PlayerStatsCollector).
+
+    Args:
+        pts, fgm, fga, ftm, fta, oreb, dreb, ast, stl, blk, tov, pf, plus_minus:
+            Raw game log columns
+        minutes: Minutes played as float
+
+    Returns:
+        Tuple of arrays (fg_pct, ts_pct, pts_per_min, poss, off_rating,
+        def_rating, game_score, usg_rate, ast_to_ratio)
+    """
+    n = pts.shape[0]
+
+    # One zero-filled block for all outputs; each metric is a row view into it.
+    # Guarded ratios only write where the denominator is usable, so games with
+    # a zero denominator keep the preset 0 without evaluating the division
+    out = np.zeros((9, n), dtype=pts.dtype)
+    fg_pct = out[0]
+    ts_pct = out[1]
+    pts_per_min = out[2]
+    poss = out[3]
+    off_rating = out[4]
+    def_rating = out[5]
+    game_score = out[6]
+    usg_rate = out[7]
+    ast_to_ratio = out[8]
+
+    for i in range(n):
+        # Shared subexpression: FGA + 0.44 * FTA
+        shot_attempts = fga[i] + 0.44 * fta[i]
+
+        # 1. Field Goal Percentage (FG%)
+        if fga[i] > 0:
+            fg_pct[i] = fgm[i] / fga[i]
+
+        # 2. True Shooting Percentage (TS%)
+        # TS% = PTS / (2 * (FGA + 0.44 * FTA))
+        if shot_attempts > 0:
+            ts_pct[i] = pts[i] / (2 * shot_attempts)
+
+        # 3. Points per Minute
+        if minutes[i] > 0:
+            pts_per_min[i] = pts[i] / minutes[i]
+
+        # 5/6. Offensive & Defensive Ratings (simplified approximations)
+        # Possessions approximation = FGA - OREB + TOV + 0.44*FTA
+        poss[i] = shot_attempts - oreb[i] + tov[i]
+
+        # Offensive Rating = Points produced per 100 possessions
+        if poss[i] > 0:
+            off_rating[i] = 100 * (pts[i] + 1.5 * ast[i]) / poss[i]
+
+        # Defensive Rating = Points allowed per 100 possessions (rough approximation)
+        if minutes[i] > 0:
+            def_rating[i] = 100 - (5 * (stl[i] + blk[i]) - pf[i] - plus_minus[i]) / minutes[i]
+
+        # 7. Game Score (John Hollinger's formula)
+        game_score[i] = (
+            pts[i] + 0.4 * fgm[i] - 0.7 * fga[i] - 0.4 * (fta[i] - ftm[i])
+            + 0.7 * oreb[i] + 0.3 * dreb[i] + stl[i] + 0.7 * ast[i]
+            + 0.7 * blk[i] - 0.4 * pf[i] - tov[i]
+        )
+
+        # 8. Usage Rate (simplified version, no team data)
+        if poss[i] != 0:
+            usg_rate[i] = 100 * (shot_attempts + tov[i]) / poss[i]
+
+        # 10. Assist-to-Turnover Ratio (raw assists when there are no turnovers)
+        if tov[i] > 0:
+            ast_to_ratio[i] = ast[i] / tov[i]
+        else:
+            ast_to_ratio[i] = ast[i]
+
+    return (fg_pct, ts_pct, pts_per_min, poss, off_rating,
+            def_rating, game_score, usg_rate, ast_to_ratio)
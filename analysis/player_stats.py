@@ -1,12 +1,31 @@
+import os
 import logging
+import functools
+from collections import defaultdict
+from datetime import date, datetime
 import numpy as np
 import pandas as pd
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import random
+import unicodedata
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from nba_api.stats.endpoints import playergamelog, playercareerstats
+from nba_api.stats.library.http import NBAStatsHTTP
 from nba_api.stats.static import players
 
+from analysis._metrics_kernel import compute_metrics
+
+# Polars is an optional backend for calculate_advanced_metrics
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -15,16 +34,167 @@ logging.basicConfig(
 logger = logging.getLogger('analysis.player_stats')
 
 
+def _normalize_name(name: str) -> str:
+    """
+    Lowercase a name and strip its accents, as nba_api's name search does.
+    
+    Args:
+        name: Player name
+        
+    Returns:
+        Normalized name, e.g. "nikola jokic" for "Nikola Jokić"
+    """
+    decomposed = unicodedata.normalize('NFD', name)
+    return ''.join(c for c in decomposed if unicodedata.category(c) != 'Mn').lower()
+
+
+# Player lookup tables built once from nba_api's static player list, keyed by
+# normalized name so unaccented input still matches accented names
+_PLAYER_BY_NAME = {}
+_PLAYERS_BY_LAST_NAME = defaultdict(list)
+for _player in players.get_players():
+    _PLAYER_BY_NAME[_normalize_name(_player['full_name'])] = _player['id']
+    _PLAYERS_BY_LAST_NAME[_normalize_name(_player['last_name'])].append(_player)
+
+
+@functools.lru_cache(maxsize=2048)
+def _find_player_id(player_name: str) -> Optional[str]:
+    """
+    Look up a player ID in nba_api's static player list.
+    
+    Results are memoized since the static list never changes during a run.
+    
+    Args:
+        player_name: Player's full name, normalized with _normalize_name
+        
+    Returns:
+        Player ID or None if not found
+    """
+    # Search for player by name
+    player_id = _PLAYER_BY_NAME.get(player_name)
+    if player_id is not None:
+        return player_id
+    
+    # If full name search fails, try last name
+    last_name_matches = _PLAYERS_BY_LAST_NAME.get(player_name.split()[-1])
+    
+    if last_name_matches:
+        # Find closest match if multiple results
+        for player in last_name_matches:
+            if player_name in _normalize_name(player['full_name']):
+                return player['id']
+        
+        # If no close match, return first result
+        return last_name_matches[0]['id']
+    
+    return None
+
+
+@functools.lru_cache(maxsize=4)
+def _get_seasons(today: date) -> Tuple[str, str]:
+    """
+    Get the current and previous NBA seasons for a date.
+    
+    Args:
+        today: Date to get the seasons for
+        
+    Returns:
+        Tuple of (current season, previous season) in format YYYY-YY
+    """
+    # If between January and September, the season started the previous year
+    start_year = today.year - 1 if today.month < 10 else today.year
+    
+    season = f"{start_year}-{(start_year + 1) % 100:02d}"
+    prev_season = f"{start_year - 1}-{start_year % 100:02d}"
+    return season, prev_season
+
+
+class _ThrottledAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that runs a throttle callback before every request it sends.
+    
+    Mounted on the cached session, it is only reached by requests that actually go
+    to the network; cache hits are answered by requests-cache without calling it.
+    """
+    
+    def __init__(self, throttle, **kwargs):
+        self._throttle = throttle
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        self._throttle()
+        return super().send(request, **kwargs)
+
+
 class PlayerStatsCollector:
     """
     Collects and processes historical player statistics using the NBA API.
     Focused on retrieving time-series compatible metrics for ARIMA modeling.
     
     Implements progressive delays and backoff strategy to handle rate limiting.
+    
+    Performance notes: the hot path is network I/O bound (each NBA API request
+    takes seconds), while the per-player math works on ~30-row frames and is
+    dominated by pandas overhead rather than arithmetic. Optimizations are
+    therefore applied in this order:
+    1. HTTP response cache on the nba_api session (requests-cache)
+    2. Thread pools to fan out requests across players and games
+    3. Parquet cache of processed player stats for the day
+    4. Numba kernel for the advanced metrics
+    5. Optional Polars backend for the metrics pipeline
+    SIMD/GPU work is not worthwhile here since the batches are too small.
     """
     
-    def __init__(self):
-        """Initialize the PlayerStatsCollector."""
+    # Raw game log columns that are coerced to numeric before computing metrics
+    NUMERIC_COLS = (
+        'MIN', 'FGM', 'FGA', 'FG3M', 'FG3A', 'FTM', 'FTA',
+        'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'PTS',
+        'PLUS_MINUS'
+    )
+    
+    # Columns to keep for time series analysis
+    TS_COLUMNS = pd.Index([
+        'GAME_DATE', 'GAME_ID',  # Identifiers
+        'FG_PCT', 'TS_PCT', 'PTS_PER_MIN',  # Efficiency metrics
+        'PLUS_MINUS', 'OFF_RATING', 'DEF_RATING', 'GAME_SCORE',  # Impact metrics
+        'USG_RATE', 'MINUTES_PLAYED', 'AST_TO_RATIO'  # Usage metrics
+    ])
+    
+    def __init__(self, cache_ttl: int = 3600, max_workers: int = 8,
+                 max_game_workers: int = 4, max_concurrent_requests: int = 10,
+                 use_polars: bool = False, stats_cache_dir: Optional[str] = 'player_stats_cache'):
+        """
+        Initialize the PlayerStatsCollector.
+        
+        Args:
+            cache_ttl: Seconds to keep cached NBA API responses (default 1 hour)
+            max_workers: Number of players to fetch concurrently per team (default 8)
+            max_game_workers: Number of games to process concurrently (default 4)
+            max_concurrent_requests: Maximum NBA API requests in flight at once (default 10)
+            use_polars: Calculate advanced metrics with Polars instead of pandas (default False)
+            stats_cache_dir: Directory for cached per-player stats as Parquet (None disables)
+        """
+        # Cache NBA API responses so repeated player/season requests skip the network
+        # (the cache key is the request URL, which includes player ID and season)
+        self.session = requests_cache.CachedSession(
+            'nba_cache',
+            backend='sqlite',
+            expire_after=cache_ttl
+        )
+        
+        # Keep-alive connection pool sized for the concurrent requests, so every call on the
+        # shared session reuses open connections instead of paying a new TCP/TLS handshake.
+        # The adapter also applies the request delay, so cached responses are never throttled
+        adapter = _ThrottledAdapter(
+            self._wait_between_requests,
+            pool_connections=max_concurrent_requests,
+            pool_maxsize=max_concurrent_requests,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        NBAStatsHTTP.set_session(self.session)
+        
         # Request counter to track API calls
         self.request_count = 0
         # Initial delay between requests (seconds)
@@ -37,6 +207,26 @@ class PlayerStatsCollector:
         self.current_delay = self.base_delay
         # Last request timestamp
         self.last_request_time = 0
+        # Timeout for each NBA API request (seconds)
+        self.request_timeout = 30
+        # Number of concurrent player fetches
+        self.max_workers = max_workers
+        # Number of concurrent game fetches
+        self.max_game_workers = max_game_workers
+        # Shared cap on in-flight NBA API requests (games and players both fan out)
+        self._request_slots = threading.BoundedSemaphore(max_concurrent_requests)
+        # Serializes the delay bookkeeping so concurrent fetches still space out their requests
+        self._throttle_lock = threading.Lock()
+        
+        # Optional Polars backend for the metrics pipeline (falls back to pandas if unavailable)
+        if use_polars and pl is None:
+            logger.warning("Polars is not installed, using pandas for advanced metrics")
+        self.use_polars = use_polars and pl is not None
+        
+        # Processed player stats are cached on disk for the rest of the day
+        self.stats_cache_dir = stats_cache_dir
+        if stats_cache_dir:
+            os.makedirs(stats_cache_dir, exist_ok=True)
     
     def _wait_between_requests(self):
         """
@@ -45,40 +235,42 @@ class PlayerStatsCollector:
         - Gradually increasing delay based on request count
         - Random jitter to prevent synchronized requests
         """
-        # Calculate time since last request
-        now = time.time()
-        time_since_last = now - self.last_request_time
-        
-        # If we've already waited longer than needed, don't wait more
-        if self.last_request_time > 0 and time_since_last > self.current_delay:
-            pass
-        else:
-            # Add a small random jitter (±10%) to avoid request synchronization
-            jitter = self.current_delay * random.uniform(-0.1, 0.1)
-            delay = max(0, self.current_delay + jitter - time_since_last)
+        with self._throttle_lock:
+            # Calculate time since last request
+            now = time.time()
+            time_since_last = now - self.last_request_time
+            
+            # If we've already waited longer than needed, don't wait more
+            if self.last_request_time > 0 and time_since_last > self.current_delay:
+                pass
+            else:
+                # Add a small random jitter (±10%) to avoid request synchronization
+                jitter = self.current_delay * random.uniform(-0.1, 0.1)
+                delay = max(0, self.current_delay + jitter - time_since_last)
+                
+                if delay > 0:
+                    logger.debug(f"Waiting {delay:.2f}s before next request (total requests: {self.request_count})")
+                    time.sleep(delay)
             
-            if delay > 0:
-                logger.debug(f"Waiting {delay:.2f}s before next request (total requests: {self.request_count})")
-                time.sleep(delay)
-        
-        # Increment request counter
-        self.request_count += 1
-        
-        # Update delay for next request (capped at max_delay)
-        self.current_delay = min(
-            self.max_delay, 
-            self.base_delay * (self.delay_factor ** (self.request_count // 10))
-        )
-        
-        # Update last request timestamp
-        self.last_request_time = time.time()
+            # Increment request counter
+            self.request_count += 1
+            
+            # Update delay for next request (capped at max_delay)
+            self.current_delay = min(
+                self.max_delay, 
+                self.base_delay * (self.delay_factor ** (self.request_count // 10))
+            )
+            
+            # Update last request timestamp
+            self.last_request_time = time.time()
     
     def _reset_delay(self):
         """Reset delay to initial value after a successful batch of requests."""
-        if self.request_count > 20:  # Only reset if we've made a significant number of requests
-            logger.info(f"Resetting delay after {self.request_count} requests")
-            self.request_count = 0
-            self.current_delay = self.base_delay
+        with self._throttle_lock:
+            if self.request_count > 20:  # Only reset if we've made a significant number of requests
+                logger.info(f"Resetting delay after {self.request_count} requests")
+                self.request_count = 0
+                self.current_delay = self.base_delay
     
     def get_player_id(self, player_name: str) -> Optional[str]:
         """
@@ -91,41 +283,60 @@ class PlayerStatsCollector:
             Player ID as string or None if not found
         """
         try:
-            # Wait before making request
-            self._wait_between_requests()
-            
-            # Search for player by name
-            player_dict = players.find_players_by_full_name(player_name)
+            # The static player list is searched locally, so no request delay is needed
+            player_id = _find_player_id(_normalize_name(player_name.strip()))
             
-            if player_dict and len(player_dict) > 0:
-                return player_dict[0]['id']
+            if player_id is None:
+                logger.warning(f"Could not find player ID for: {player_name}")
             
-            # If full name search fails, try last name
-            last_name = player_name.split()[-1]
-            
-            # Wait before making another request
-            self._wait_between_requests()
-            
-            player_dict = players.find_players_by_last_name(last_name)
-            
-            if player_dict and len(player_dict) > 0:
-                # Find closest match if multiple results
-                for player in player_dict:
-                    if player_name.lower() in player['full_name'].lower():
-                        return player['id']
-                
-                # If no close match, return first result
-                return player_dict[0]['id']
-            
-            logger.warning(f"Could not find player ID for: {player_name}")
-            return None
+            return player_id
             
         except Exception as e:
             logger.error(f"Error getting player ID for {player_name}: {str(e)}")
-            # Implement exponential backoff for failures
-            self.current_delay = min(self.max_delay, self.current_delay * 2)
             return None
     
+    def _fetch_game_log(self, player_id: str, season: str) -> pd.DataFrame:
+        """
+        Request one season of game logs for a player from the NBA API.
+        
+        Args:
+            player_id: NBA API player ID
+            season: Season in format YYYY-YY
+            
+        Returns:
+            DataFrame with game-by-game stats for the season
+        """
+        # Cap the number of requests in flight across all worker threads
+        # (the request delay is applied by the session's adapter on cache misses)
+        with self._request_slots:
+            game_logs = playergamelog.PlayerGameLog(
+                player_id=player_id,
+                season=season,
+                timeout=self.request_timeout
+            )
+            return game_logs.get_data_frames()[0]
+    
+    @staticmethod
+    def _sort_game_log(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse a season's game dates and order its games most recent first.
+        
+        Runs before the season is trimmed to the requested number of games, so the
+        most recent games are the ones kept even if the API returns them out of order.
+        
+        Args:
+            df: One season of game logs from the NBA API
+            
+        Returns:
+            DataFrame with GAME_DATE parsed and games sorted by date, descending
+        """
+        # Parse game dates (e.g. 'APR 12, 2024') so they order chronologically; nba_api
+        # usually returns them in order already, so only sort when it doesn't
+        df = df.assign(GAME_DATE=pd.to_datetime(df['GAME_DATE'], format='%b %d, %Y'))
+        if not df['GAME_DATE'].is_monotonic_decreasing:
+            df = df.sort_values('GAME_DATE', ascending=False, kind='stable', ignore_index=True)
+        return df
+    
     def get_recent_game_logs(self, player_name: str, num_games: int = 30) -> Optional[pd.DataFrame]:
         """
         Retrieve recent game logs for a player.
@@ -143,45 +354,21 @@ class PlayerStatsCollector:
             if not player_id:
                 return None
             
-            # Get current season in format YYYY-YY
-            from datetime import datetime
-            current_year = datetime.now().year
-            current_month = datetime.now().month
-            
-            # If between January and September, use previous year
-            if current_month < 10:
-                season = f"{current_year-1}-{str(current_year)[-2:]}"
-            else:
-                season = f"{current_year}-{str(current_year+1)[-2:]}"
-            
-            # Wait before making request
-            self._wait_between_requests()
+            # Get current and previous seasons in format YYYY-YY
+            season, prev_season = _get_seasons(date.today())
             
             # Get game logs for most recent season
-            game_logs = playergamelog.PlayerGameLog(
-                player_id=player_id,
-                season=season
-            )
-            df = game_logs.get_data_frames()[0]
+            df = self._sort_game_log(self._fetch_game_log(player_id, season))
             
             # If we don't have enough games from current season, get previous season too
             if len(df) < num_games:
-                prev_season = f"{int(season.split('-')[0])-1}-{int(season.split('-')[0])%100:02d}"
-                
-                # Wait before making another request
-                self._wait_between_requests()
+                prev_df = self._sort_game_log(self._fetch_game_log(player_id, prev_season))
                 
-                prev_logs = playergamelog.PlayerGameLog(
-                    player_id=player_id,
-                    season=prev_season
-                )
-                prev_df = prev_logs.get_data_frames()[0]
-                
-                # Combine current and previous season
-                df = pd.concat([df, prev_df])
-            
-            # Take only requested number of games
-            df = df.head(num_games)
+                # Combine current season with only as many previous season games as needed
+                df = pd.concat([df, prev_df.iloc[:num_games - len(df)]], ignore_index=True)
+            else:
+                # Take only requested number of games
+                df = df.iloc[:num_games]
             
             if len(df) == 0:
                 logger.warning(f"No game logs found for player: {player_name}")
@@ -203,88 +390,231 @@ class PlayerStatsCollector:
             game_logs: DataFrame with raw game log stats
             
         Returns:
-            DataFrame with added advanced metrics
+            DataFrame with the game identifiers and advanced metrics
         """
-        # Make a copy to avoid modifying the original
-        df = game_logs.copy()
-        
         try:
-            # Convert necessary columns to numeric format
-            numeric_cols = ['MIN', 'FGM', 'FGA', 'FG3M', 'FG3A', 'FTM', 'FTA', 
-                           'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'PTS',
-                           'PLUS_MINUS']
-            
-            for col in numeric_cols:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-                else:
-                    logger.warning(f"Column {col} not found in game logs")
-            
-            # Fill NaN values with 0
-            df = df.fillna(0)
+            if self.use_polars:
+                return self._calculate_advanced_metrics_polars(game_logs)
             
             # Calculate minutes as float (convert '12:34' format to minutes)
-            df['MINUTES_PLAYED'] = df['MIN'].apply(
-                lambda x: float(x.split(':')[0]) + float(x.split(':')[1])/60 if isinstance(x, str) and ':' in x else float(x)
-            )
-            
-            # 1. Field Goal Percentage (FG%)
-            df['FG_PCT'] = np.where(df['FGA'] > 0, df['FGM'] / df['FGA'], 0)
+            # The format is decided once per column: nba_api normally returns numeric minutes,
+            # and only text columns need the 'MM:SS' split
+            if pd.api.types.is_numeric_dtype(game_logs['MIN']):
+                minutes = game_logs['MIN'].fillna(0).to_numpy(dtype=np.float32)
+            else:
+                min_parts = game_logs['MIN'].astype(str).str.split(':', n=1, expand=True)
+                minutes = pd.to_numeric(min_parts[0], errors='coerce')
+                if min_parts.shape[1] > 1:
+                    # Rows without a seconds part have None here and add nothing
+                    minutes = minutes + pd.to_numeric(min_parts[1], errors='coerce').fillna(0) / 60.0
+                minutes = minutes.fillna(0).to_numpy(dtype=np.float32)
+            
+            # Convert necessary columns to numeric format in a single pass
+            present_cols = [col for col in self.NUMERIC_COLS if col in game_logs.columns]
+            for col in self.NUMERIC_COLS:
+                if col not in present_cols:
+                    logger.warning(f"Column {col} not found in game logs")
             
-            # 2. True Shooting Percentage (TS%)
-            # TS% = PTS / (2 * (FGA + 0.44 * FTA))
-            df['TS_PCT'] = np.where(
-                (df['FGA'] + 0.44 * df['FTA']) > 0,
-                df['PTS'] / (2 * (df['FGA'] + 0.44 * df['FTA'])),
-                0
+            # Fill NaN values with 0 (only in the numeric columns, not e.g. GAME_DATE)
+            stats = game_logs[present_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
+            
+            # Pull each column out as a float32 ndarray for the metrics kernel; the metrics are
+            # percentages and ratings, so single precision is plenty and halves the memory traffic
+            pts = stats['PTS'].to_numpy(dtype=np.float32)
+            fgm = stats['FGM'].to_numpy(dtype=np.float32)
+            fga = stats['FGA'].to_numpy(dtype=np.float32)
+            ftm = stats['FTM'].to_numpy(dtype=np.float32)
+            fta = stats['FTA'].to_numpy(dtype=np.float32)
+            oreb = stats['OREB'].to_numpy(dtype=np.float32)
+            dreb = stats['DREB'].to_numpy(dtype=np.float32)
+            ast = stats['AST'].to_numpy(dtype=np.float32)
+            stl = stats['STL'].to_numpy(dtype=np.float32)
+            blk = stats['BLK'].to_numpy(dtype=np.float32)
+            tov = stats['TOV'].to_numpy(dtype=np.float32)
+            pf = stats['PF'].to_numpy(dtype=np.float32)
+            plus_minus = stats['PLUS_MINUS'].to_numpy(dtype=np.float32)
+            
+            # Compute all metrics in a single compiled pass over the games
+            (
+                fg_pct, ts_pct, pts_per_min, poss, off_rating,
+                def_rating, game_score, usg_rate, ast_to_ratio
+            ) = compute_metrics(
+                pts, fgm, fga, ftm, fta, oreb, dreb, ast, stl, blk, tov, pf, plus_minus, minutes
             )
             
-            # 3. Points per Minute
-            df['PTS_PER_MIN'] = np.where(df['MINUTES_PLAYED'] > 0, df['PTS'] / df['MINUTES_PLAYED'], 0)
-            
-            # 4. Plus/Minus already in the data as PLUS_MINUS
-            
-            # 5/6. Offensive & Defensive Ratings (simplified approximations)
-            # These are complex ratings that usually require team data
-            # Using simplified calculations based on individual performance
+            # Build the output frame in one go instead of copying the input
+            # and inserting the metric columns one at a time
+            metrics = {
+                col: game_logs[col] for col in ('GAME_DATE', 'GAME_ID') if col in game_logs.columns
+            }
+            metrics.update({
+                'FG_PCT': fg_pct,
+                'TS_PCT': ts_pct,
+                'PTS_PER_MIN': pts_per_min,
+                'PLUS_MINUS': plus_minus.astype(np.int32),
+                'POSS': poss,
+                'OFF_RATING': off_rating,
+                'DEF_RATING': def_rating,
+                'GAME_SCORE': game_score,
+                'USG_RATE': usg_rate,
+                'MINUTES_PLAYED': minutes,
+                'AST_TO_RATIO': ast_to_ratio
+            })
+            
+            return pd.DataFrame(metrics, index=game_logs.index)
             
-            # Possessions approximation = FGA - OREB + TOV + 0.44*FTA
-            df['POSS'] = df['FGA'] - df['OREB'] + df['TOV'] + 0.44 * df['FTA']
-            
-            # Offensive Rating = Points produced per 100 possessions
-            df['OFF_RATING'] = np.where(df['POSS'] > 0, 100 * (df['PTS'] + 1.5 * df['AST']) / df['POSS'], 0)
-            
-            # Defensive Rating = Points allowed per 100 possessions (rough approximation)
-            # This is a simplified version (truly accurate defensive rating requires team data)
-            df['DEF_RATING'] = np.where(
-                df['MINUTES_PLAYED'] > 0,
-                100 - (5 * (df['STL'] + df['BLK']) - df['PF'] - df['PLUS_MINUS']) / df['MINUTES_PLAYED'],
-                0
-            )
+        except Exception as e:
+            logger.error(f"Error calculating advanced metrics: {str(e)}")
+            return game_logs  # Return original if calculation fails
+    
+    def _calculate_advanced_metrics_polars(self, game_logs: pd.DataFrame) -> pd.DataFrame:
+        """
+        Polars implementation of calculate_advanced_metrics.
+        
+        Builds the same output frame as the pandas path from a single lazy query.
+        
+        Args:
+            game_logs: DataFrame with raw game log stats
             
-            # 7. Game Score (John Hollinger's formula)
-            # GmSc = PTS + 0.4*FGM - 0.7*FGA - 0.4*(FTA-FTM) + 0.7*OREB + 0.3*DREB + STL + 0.7*AST + 0.7*BLK - 0.4*PF - TOV
-            df['GAME_SCORE'] = (
-                df['PTS'] + 0.4 * df['FGM'] - 0.7 * df['FGA'] - 0.4 * (df['FTA'] - df['FTM']) 
-                + 0.7 * df['OREB'] + 0.3 * df['DREB'] + df['STL'] + 0.7 * df['AST'] 
-                + 0.7 * df['BLK'] - 0.4 * df['PF'] - df['TOV']
+        Returns:
+            DataFrame with the game identifiers and advanced metrics
+        """
+        present_cols = [col for col in self.NUMERIC_COLS if col in game_logs.columns]
+        for col in self.NUMERIC_COLS:
+            if col not in present_cols:
+                logger.warning(f"Column {col} not found in game logs")
+        id_cols = [col for col in ('GAME_DATE', 'GAME_ID') if col in game_logs.columns]
+        
+        def numeric(col):
+            # Coerce to float, treating unparseable values as 0
+            return pl.col(col).cast(pl.Utf8).cast(pl.Float32, strict=False).fill_nan(0).fill_null(0)
+        
+        def ratio(num, denom, default=0.0):
+            return pl.when(denom > 0).then(num / denom).otherwise(default)
+        
+        # Calculate minutes as float (convert '12:34' format to minutes, numeric columns as-is)
+        if pd.api.types.is_numeric_dtype(game_logs['MIN']):
+            minutes = pl.col('MIN').cast(pl.Float32).fill_nan(0).fill_null(0)
+        else:
+            min_parts = pl.col('MIN').cast(pl.Utf8).str.split_exact(':', 1)
+            minutes = (
+                min_parts.struct.field('field_0').cast(pl.Float32, strict=False)
+                + min_parts.struct.field('field_1').cast(pl.Float32, strict=False).fill_null(0) / 60.0
+            ).fill_null(0)
+        
+        lf = (
+            pl.from_pandas(game_logs[id_cols + present_cols])
+            .lazy()
+            .with_columns(
+                [numeric(col).alias(col) for col in present_cols if col != 'MIN']
+                + [minutes.alias('MINUTES_PLAYED')]
             )
+        )
+        
+        pts, fgm, fga = pl.col('PTS'), pl.col('FGM'), pl.col('FGA')
+        ftm, fta = pl.col('FTM'), pl.col('FTA')
+        oreb, dreb, ast = pl.col('OREB'), pl.col('DREB'), pl.col('AST')
+        stl, blk, tov, pf = pl.col('STL'), pl.col('BLK'), pl.col('TOV'), pl.col('PF')
+        plus_minus, mins = pl.col('PLUS_MINUS'), pl.col('MINUTES_PLAYED')
+        
+        # Shared subexpressions: FGA + 0.44 * FTA and the possessions approximation
+        shot_attempts = fga + 0.44 * fta
+        poss = shot_attempts - oreb + tov
+        
+        result = lf.select(
+            [pl.col(col) for col in id_cols]
+            + [
+                ratio(fgm, fga).alias('FG_PCT'),
+                ratio(pts, 2 * shot_attempts).alias('TS_PCT'),
+                ratio(pts, mins).alias('PTS_PER_MIN'),
+                plus_minus.cast(pl.Int32).alias('PLUS_MINUS'),
+                poss.alias('POSS'),
+                ratio(100 * (pts + 1.5 * ast), poss).alias('OFF_RATING'),
+                pl.when(mins > 0)
+                .then(100 - (5 * (stl + blk) - pf - plus_minus) / mins)
+                .otherwise(0.0)
+                .alias('DEF_RATING'),
+                (
+                    pts + 0.4 * fgm - 0.7 * fga - 0.4 * (fta - ftm)
+                    + 0.7 * oreb + 0.3 * dreb + stl + 0.7 * ast
+                    + 0.7 * blk - 0.4 * pf - tov
+                ).alias('GAME_SCORE'),
+                pl.when(poss != 0)
+                .then(100 * (shot_attempts + tov) / poss)
+                .otherwise(0.0)
+                .alias('USG_RATE'),
+                mins.alias('MINUTES_PLAYED'),
+                ratio(ast, tov, default=ast).alias('AST_TO_RATIO')
+            ]
+        ).with_columns(
+            pl.col(pl.Float64).cast(pl.Float32)
+        ).collect()
+        
+        metrics = result.to_pandas()
+        metrics.index = game_logs.index
+        return metrics
+    
+    def _get_stats_cache_path(self, player_name: str, num_games: int) -> Optional[str]:
+        """
+        Get the Parquet cache file path for a player's processed stats.
+        
+        Args:
+            player_name: Player's full name
+            num_games: Number of recent games requested
             
-            # 8. Usage Rate (simplified version)
-            # USG% = 100 * ((FGA + 0.44 * FTA + TOV) * (Team MP / 5)) / (MP * (Team FGA + 0.44 * Team FTA + Team TOV))
-            # Since team data isn't in game logs, using approximation:
-            df['USG_RATE'] = 100 * (df['FGA'] + 0.44 * df['FTA'] + df['TOV']) / df['POSS']
-            
-            # 9. Minutes Played already calculated as MINUTES_PLAYED
-            
-            # 10. Assist-to-Turnover Ratio
-            df['AST_TO_RATIO'] = np.where(df['TOV'] > 0, df['AST'] / df['TOV'], df['AST'])
-            
-            return df
+        Returns:
+            Cache file path, or None if caching is disabled or the player is unknown
+        """
+        if not self.stats_cache_dir:
+            return None
+        
+        player_id = self.get_player_id(player_name)
+        if not player_id:
+            return None
+        
+        # The season is implied by the date, and cached files are only used on the day they're written
+        return os.path.join(self.stats_cache_dir, f"{player_id}_{num_games}.parquet")
+    
+    def _load_cached_stats(self, cache_path: str) -> Optional[pd.DataFrame]:
+        """
+        Load cached player stats if they were computed today.
+        
+        Args:
+            cache_path: Cache file path
             
+        Returns:
+            Cached DataFrame or None if missing or stale
+        """
+        try:
+            modified = datetime.fromtimestamp(os.path.getmtime(cache_path)).date()
+        except OSError:
+            return None
+        
+        # Game logs only change when new games are played, so anything from a previous day is stale
+        if modified != date.today():
+            return None
+        
+        try:
+            return pd.read_parquet(cache_path)
         except Exception as e:
-            logger.error(f"Error calculating advanced metrics: {str(e)}")
-            return game_logs  # Return original if calculation fails
+            logger.warning(f"Error reading cached stats from {cache_path}: {str(e)}")
+            return None
+    
+    def _save_cached_stats(self, cache_path: str, stats: pd.DataFrame) -> None:
+        """
+        Write player stats to the Parquet cache.
+        
+        Args:
+            cache_path: Cache file path
+            stats: Processed player stats
+        """
+        try:
+            # Write to a temporary file first so concurrent readers never see a partial file
+            tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            stats.to_parquet(tmp_path, compression='snappy')
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Error caching stats to {cache_path}: {str(e)}")
     
     def get_player_stats(self, player_name: str, num_games: int = 30) -> Optional[pd.DataFrame]:
         """
@@ -300,6 +630,14 @@ class PlayerStatsCollector:
         # Log the start of player stats retrieval
         logger.info(f"Retrieving stats for player: {player_name}")
         
+        # Reuse stats already computed today, skipping both the API calls and the metrics
+        cache_path = self._get_stats_cache_path(player_name, num_games)
+        if cache_path:
+            cached_stats = self._load_cached_stats(cache_path)
+            if cached_stats is not None:
+                logger.info(f"Using cached stats for player: {player_name}")
+                return cached_stats
+        
         # Get basic game logs
         game_logs = self.get_recent_game_logs(player_name, num_games)
         if game_logs is None:
@@ -311,39 +649,42 @@ class PlayerStatsCollector:
         
         # Select only the metrics we need for time series analysis
         if player_stats is not None:
-            # Define columns to keep for time series analysis
-            ts_columns = [
-                'GAME_DATE', 'GAME_ID',  # Identifiers
-                'FG_PCT', 'TS_PCT', 'PTS_PER_MIN',  # Efficiency metrics
-                'PLUS_MINUS', 'OFF_RATING', 'DEF_RATING', 'GAME_SCORE',  # Impact metrics
-                'USG_RATE', 'MINUTES_PLAYED', 'AST_TO_RATIO'  # Usage metrics
-            ]
+            # Keep only time series columns that exist in the dataframe (in TS_COLUMNS order)
+            available_columns = self.TS_COLUMNS.intersection(player_stats.columns, sort=False)
+            
+            filtered_stats = player_stats[available_columns]
             
-            # Keep only columns that exist in the dataframe
-            available_columns = [col for col in ts_columns if col in player_stats.columns]
+            # Game logs are sorted on ingestion, so only re-sort if the order was lost (most recent first)
+            if 'GAME_DATE' in filtered_stats.columns and not filtered_stats['GAME_DATE'].is_monotonic_decreasing:
+                filtered_stats = filtered_stats.sort_values('GAME_DATE', ascending=False, kind='stable')
             
-            # Filter and sort by date (most recent first)
-            filtered_stats = player_stats[available_columns].sort_values('GAME_DATE', ascending=False)
+            # Only cache complete results; if the metrics failed, calculate_advanced_metrics
+            # passed the raw logs through, and caching those would serve them all day
+            if cache_path and available_columns.equals(self.TS_COLUMNS):
+                self._save_cached_stats(cache_path, filtered_stats)
             
             logger.info(f"Successfully retrieved stats for player: {player_name}")
             return filtered_stats
         
         return None
     
-    def get_team_players_stats(self, team_name: str, lineup: List[Dict[str, Any]]) -> Dict[str, pd.DataFrame]:
+    def get_team_players_stats(self, team_name: str, lineup: List[Dict[str, Any]],
+                               num_games: int = 30) -> Dict[str, pd.DataFrame]:
         """
         Retrieve stats for all players in a team's lineup.
         
         Args:
             team_name: Name of the team
             lineup: List of player dictionaries
+            num_games: Number of recent games to retrieve per player
             
         Returns:
             Dictionary mapping player names to their stats DataFrames
         """
         team_stats = {}
+        active_players = []
         
-        for i, player in enumerate(lineup):
+        for player in lineup:
             player_name = player.get('name')
             if not player_name:
                 continue
@@ -353,19 +694,86 @@ class PlayerStatsCollector:
             if status and status != 'active':
                 logger.info(f"Skipping injured player: {player_name} ({status})")
                 continue
-                
-            # Get player stats
-            player_stats = self.get_player_stats(player_name)
             
-            if player_stats is not None and not player_stats.empty:
-                team_stats[player_name] = player_stats
-            
-            # Reset delay periodically to adapt to changing conditions
-            if (i + 1) % 5 == 0:
-                self._reset_delay()
+            active_players.append(player_name)
+        
+        # Fetch players concurrently since each fetch is dominated by NBA API latency;
+        # _wait_between_requests still spaces out the individual requests
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.get_player_stats, player_name, num_games): player_name
+                for player_name in active_players
+            }
+            
+            # Collect results in lineup order
+            for i, (future, player_name) in enumerate(futures.items()):
+                try:
+                    player_stats = future.result()
+                except Exception as e:
+                    logger.error(f"Error retrieving stats for {player_name}: {str(e)}")
+                    continue
+                
+                if player_stats is not None and not player_stats.empty:
+                    team_stats[player_name] = player_stats
+                
+                # Reset delay periodically to adapt to changing conditions
+                if (i + 1) % 5 == 0:
+                    self._reset_delay()
         
         logger.info(f"Retrieved stats for {len(team_stats)} players from {team_name}")
         return team_stats
+    
+    def _process_one_game(self, game: Dict[str, Any],
+                          num_games: int = 30) -> Tuple[str, Dict[str, Dict[str, pd.DataFrame]]]:
+        """
+        Retrieve stats for both teams' lineups in a game.
+        
+        Args:
+            game: Game dictionary with team names and lineups
+            num_games: Number of recent games to retrieve per player
+            
+        Returns:
+            Tuple of (game_id, dictionary with 'home' and 'away' team stats)
+        """
+        game_stats = {
+            'home': self.get_team_players_stats(game['home_team'], game.get('home_lineup', []), num_games),
+            'away': self.get_team_players_stats(game['away_team'], game.get('away_lineup', []), num_games)
+        }
+        return game['game_id'], game_stats
+    
+    def collect_stats_for_games(self, games: List[Dict[str, Any]],
+                                num_games: int = 30) -> Dict[str, Dict[str, Dict[str, pd.DataFrame]]]:
+        """
+        Retrieve player stats for every game in a slate.
+        
+        Args:
+            games: List of game dictionaries (e.g. from RotowireScraper)
+            num_games: Number of recent games to retrieve per player
+            
+        Returns:
+            Dictionary mapping game IDs to their 'home' and 'away' team stats
+        """
+        # Games are processed concurrently as well, since each one is mostly
+        # waiting on NBA API responses for its players
+        all_stats = {}
+        with ThreadPoolExecutor(max_workers=self.max_game_workers) as executor:
+            futures = {
+                executor.submit(self._process_one_game, game, num_games): game
+                for game in games
+            }
+            
+            # Collect results in slate order, skipping games that fail
+            for future, game in futures.items():
+                try:
+                    game_id, game_stats = future.result()
+                except Exception as e:
+                    logger.error(f"Error retrieving stats for game {game.get('game_id', 'unknown')}: {str(e)}")
+                    continue
+                
+                all_stats[game_id] = game_stats
+        
+        logger.info(f"Retrieved stats for {len(all_stats)} games")
+        return all_stats
 
 
 # Example usage when run as script
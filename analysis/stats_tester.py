@@ -11,6 +11,7 @@ This script tests the PlayerStatsCollector class by:
 import os
 import sys
 import logging
+import numbers
 from typing import Dict, List, Any
 
 # Add the parent directory to the path so we can import our modules
@@ -50,9 +51,13 @@ def main():
         test_sample_players(stats_collector)
         return
     
+    # Fetch stats for the whole slate up front (games and players are fetched concurrently)
+    all_stats = stats_collector.collect_stats_for_games(games, num_games=10)
+    
     # Process each game
     for game_idx, game in enumerate(games):
         print(f"\n=== Game {game_idx+1}: {game['away_team']} @ {game['home_team']} ===")
+        game_stats = all_stats.get(game['game_id'], {})
         
         # Process both teams
         for team_type, team_name, lineup in [
@@ -60,6 +65,7 @@ def main():
             ("Home", game['home_team'], game['home_lineup'])
         ]:
             print(f"\n--- {team_name} Players ---")
+            team_stats = game_stats.get(team_type.lower(), {})
             
             # Process each player in lineup
             for player in lineup:
@@ -67,45 +73,51 @@ def main():
                 if not player_name:
                     continue
                 
-                print_player_stats(stats_collector, player_name)
+                print(f"\n{player_name}")
+                print_stats(team_stats.get(player_name))
 
 
 def print_player_stats(stats_collector, player_name):
-    """Print stats for a single player."""
+    """Fetch and print stats for a single player."""
     # Print player name
     print(f"\n{player_name}")
     
     try:
         # Get player stats
         stats_df = stats_collector.get_player_stats(player_name, num_games=10)
-        
-        if stats_df is not None and not stats_df.empty:
-            # Get most recent game stats (first row)
-            recent_game = stats_df.iloc[0]
-            
-            # Print key stats
-            stats_to_show = [
-                'FG_PCT', 'TS_PCT', 'PTS_PER_MIN', 'PLUS_MINUS', 
-                'OFF_RATING', 'DEF_RATING', 'GAME_SCORE', 'USG_RATE', 
-                'MINUTES_PLAYED', 'AST_TO_RATIO'
-            ]
-            
-            for stat in stats_to_show:
-                if stat in stats_df.columns:
-                    value = recent_game[stat]
-                    # Format as float with 2 decimal places if numeric
-                    if isinstance(value, (int, float)):
-                        print(f"{stat}: {value:.2f}")
-                    else:
-                        print(f"{stat}: {value}")
-        else:
-            print("No stats available")
+        print_stats(stats_df)
             
     except Exception as e:
         logger.error(f"Error retrieving stats for {player_name}: {str(e)}")
         print(f"Error: {str(e)}")
 
 
+def print_stats(stats_df):
+    """Print the most recent game's key stats from a player's stats DataFrame."""
+    if stats_df is not None and not stats_df.empty:
+        # Get most recent game stats (first row)
+        recent_game = stats_df.iloc[0]
+        
+        # Print key stats
+        stats_to_show = [
+            'FG_PCT', 'TS_PCT', 'PTS_PER_MIN', 'PLUS_MINUS', 
+            'OFF_RATING', 'DEF_RATING', 'GAME_SCORE', 'USG_RATE', 
+            'MINUTES_PLAYED', 'AST_TO_RATIO'
+        ]
+        
+        for stat in stats_to_show:
+            if stat in stats_df.columns:
+                value = recent_game[stat]
+                # Format as float with 2 decimal places if numeric (including the
+                # float32/int32 numpy scalars the metrics are stored as)
+                if isinstance(value, numbers.Real):
+                    print(f"{stat}: {value:.2f}")
+                else:
+                    print(f"{stat}: {value}")
+    else:
+        print("No stats available")
+
+
 def test_sample_players(stats_collector):
     """Test with sample players if no games are found."""
     sample_players = [
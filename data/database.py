@@ -1,7 +1,8 @@
 import os
 import sqlite3
-import datetime
 import logging
+import threading
+import weakref
 from contextlib import contextmanager
 from typing import Dict, List, Any, Optional
 
@@ -12,12 +13,123 @@ logging.basicConfig(
 )
 logger = logging.getLogger('database')
 
+# Column order for each table; the fixed SQL below and the row tuples built by the
+# insert methods both follow these, so values never depend on dict key order
+GAME_COLS = ('game_id', 'home_team', 'away_team', 'game_date', 'game_time', 'venue')
+PLAYER_COLS = ('name', 'team', 'position', 'status', 'game_id')
+
+# SQL statements are fixed strings so each call site always sends identical text,
+# which lets sqlite3's per-connection statement cache skip re-parsing them
+UPSERT_PLAYER_SQL = f"""
+INSERT INTO players ({', '.join(PLAYER_COLS)})
+VALUES ({', '.join('?' * len(PLAYER_COLS))})
+ON CONFLICT(game_id, team, name) DO UPDATE SET
+    position = excluded.position,
+    status = excluded.status
+"""
+
+UPSERT_GAME_SQL = f"""
+INSERT INTO games ({', '.join(GAME_COLS)})
+VALUES ({', '.join('?' * len(GAME_COLS))})
+ON CONFLICT(game_id) DO UPDATE SET
+    game_date = excluded.game_date,
+    game_time = excluded.game_time,
+    venue = excluded.venue
+"""
+
+# Bump SCHEMA_VERSION whenever SCHEMA_SQL changes so existing databases run it again;
+# every statement is idempotent, and the whole script applies in one transaction
+SCHEMA_VERSION = 1
+
+SCHEMA_SQL = f"""
+BEGIN;
+
+-- Games table (minimal version)
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    game_date TEXT NOT NULL,
+    game_time TEXT NOT NULL,
+    venue TEXT
+);
+
+-- Players table (minimal version)
+CREATE TABLE IF NOT EXISTS players (
+    name TEXT NOT NULL,
+    team TEXT NOT NULL,
+    position TEXT,
+    status TEXT DEFAULT 'active',
+    game_id TEXT,
+    FOREIGN KEY (game_id) REFERENCES games(game_id)
+);
+
+-- Index games by date for schedule lookups (ordered by tip-off time)
+CREATE INDEX IF NOT EXISTS idx_games_date_time ON games(game_date, game_time);
+
+-- One row per player per game and team, so re-scraping a slate updates lineups
+-- in place. Older databases may already hold repeats from earlier scrapes;
+-- keep the most recent of each before the unique index is built. Rows without
+-- a game never conflict under the index (NULLs are distinct), so leave them be
+DELETE FROM players WHERE game_id IS NOT NULL AND rowid NOT IN (
+    SELECT MAX(rowid) FROM players WHERE game_id IS NOT NULL GROUP BY game_id, team, name
+);
+
+-- Index players by game; the unique index leads with game_id, the foreign key
+-- column, which SQLite otherwise has to scan whenever a referenced game changes
+CREATE UNIQUE INDEX IF NOT EXISTS idx_players_game_team_name ON players(game_id, team, name);
+
+-- Refresh planner statistics so the new indexes are used
+ANALYZE;
+
+PRAGMA user_version = {SCHEMA_VERSION};
+
+COMMIT;
+"""
+
+def _close_connections(connections: List[sqlite3.Connection], lock: threading.Lock) -> None:
+    """
+    Optimize and close a list of connections, emptying the list in place.
+    
+    Before closing, refreshes planner statistics and truncates the WAL file so the
+    next process opening the database doesn't have to read through old WAL frames.
+    
+    Args:
+        connections: Connections to close
+        lock: Lock guarding the list
+    """
+    with lock:
+        for i, conn in enumerate(connections):
+            try:
+                conn.execute("PRAGMA optimize")
+                # Checkpoint from the last connection, once no other handle can hold
+                # a read snapshot that would stop the WAL from being truncated
+                if i == len(connections) - 1:
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.warning(f"Could not optimize database before closing: {e}")
+            conn.close()
+        connections.clear()
+
 class Database:
     """
     Minimal SQLite database manager for NBA Stats Predictor.
     Only stores today's games and lineups.
     """
     
+    # Applied to every new connection: WAL with NORMAL sync avoids a full fsync per commit
+    # and lets readers run alongside the writer; the rest are per-connection cache settings
+    CONNECTION_PRAGMAS = """
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA cache_size = -65536;
+        PRAGMA busy_timeout = 5000;
+        PRAGMA wal_autocheckpoint = 1000;
+        PRAGMA foreign_keys = ON;
+    """
+    
     def __init__(self, db_path: str = "nba_stats.db"):
         """Initialize the database manager."""
         # For in-memory database
@@ -28,52 +140,213 @@ class Database:
             db_dir = os.path.dirname(os.path.abspath(db_path))
             os.makedirs(db_dir, exist_ok=True)
             self.db_path = db_path
+        
+        # One long-lived connection per thread (sqlite3 connections shouldn't be shared
+        # across threads), plus a registry of all of them so close_all() can shut them down
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        
+        # Checkpoint and close the connections when this manager is garbage collected
+        # or the process exits; the finalizer only holds the list and lock, not self,
+        # so it doesn't keep the manager alive
+        weakref.finalize(self, _close_connections, self._connections, self._connections_lock)
+    
+    def _get_conn(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection, opening and configuring it on first use.
+        
+        Returns:
+            SQLite connection for the current thread
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            if self.db_path == ":memory:":
+                # Named shared-cache database so every thread sees the same in-memory data
+                conn = sqlite3.connect(
+                    f"file:nba_stats_{id(self)}?mode=memory&cache=shared",
+                    uri=True,
+                    isolation_level=None,
+                    check_same_thread=False
+                )
+            else:
+                conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            # isolation_level=None stops the driver from opening implicit transactions
+            # before DML; writes group themselves explicitly through transaction()
+            # Rows come back as plain tuples; no sqlite3.Row is built per row
+            conn.executescript(self.CONNECTION_PRAGMAS)
+            
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
     
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections."""
-        conn = None
+        """
+        Context manager for database connections.
+        
+        Yields this thread's cached connection in autocommit mode. Only a transaction
+        the block itself opened with BEGIN is committed on success and rolled back on
+        error; inside transaction() the block just joins the open transaction. The
+        connection stays open for reuse until close_all().
+        """
+        conn = self._get_conn()
+        # A transaction already open here belongs to an enclosing transaction(),
+        # which commits or rolls it back itself
+        owned = not conn.in_transaction
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
             yield conn
+            if owned and conn.in_transaction:
+                conn.commit()
         except sqlite3.Error as e:
             logger.error(f"Database connection error: {e}")
-            if conn:
+            if owned:
+                conn.rollback()
+            raise
+        except Exception:
+            if owned:
                 conn.rollback()
             raise
-        finally:
-            if conn:
-                conn.close()
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager that groups several writes into one transaction.
+        
+        Takes the write lock up front with BEGIN IMMEDIATE and commits once when the
+        outermost block exits, or rolls back if it raises. Nested use joins the
+        transaction that is already open.
+        
+        Yields:
+            This thread's connection, to pass as ``conn`` to the write methods
+        """
+        conn = self._get_conn()
+        if conn.in_transaction:
+            yield conn
+            return
+        
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Database transaction error: {e}")
+            conn.rollback()
+            raise
+        except Exception:
+            conn.rollback()
+            raise
+    
+    def close_all(self) -> None:
+        """
+        Close every connection opened by this database manager.
+        
+        Connections are optimized and the WAL truncated first (see _close_connections).
+        """
+        _close_connections(self._connections, self._connections_lock)
+        # Fresh thread-local storage so every thread reconnects on next use
+        self._local = threading.local()
     
     def initialize_database(self) -> None:
-        """Create minimal tables for storing today's games and lineups."""
+        """
+        Create minimal tables for storing today's games and lineups.
+        
+        The schema script only runs when the database's user_version is older than
+        SCHEMA_VERSION, so reopening an up-to-date database skips it entirely.
+        """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                logger.info(f"Database schema is up to date (version {version})")
+                return
             
-            # Create Games table (minimal version)
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS games (
-                game_id TEXT PRIMARY KEY,
-                home_team TEXT NOT NULL,
-                away_team TEXT NOT NULL,
-                game_date TEXT NOT NULL,
-                game_time TEXT NOT NULL,
-                venue TEXT
-            )
-            ''')
+            conn.executescript(SCHEMA_SQL)
+            logger.info("Database tables initialized successfully")
+    
+    def insert_players(self, players: List[Dict[str, Any]],
+                       conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Insert or update multiple players in a single transaction.
+        
+        A player already stored for the same game and team gets the new position and
+        status instead of a duplicate row.
+        
+        Args:
+            players: List of player dictionaries
+            conn: Connection from an open transaction(); the insert then joins it
+                and is committed with it instead of on its own
             
-            # Create Players table (minimal version)
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS players (
-                name TEXT NOT NULL,
-                team TEXT NOT NULL,
-                position TEXT,
-                status TEXT DEFAULT 'active',
-                game_id TEXT,
-                FOREIGN KEY (game_id) REFERENCES games(game_id)
+        Returns:
+            Number of players saved
+        """
+        rows = [
+            (
+                player.get('name'),
+                player.get('team'),
+                player.get('position'),
+                player.get('status', 'active'),
+                player.get('game_id')
             )
-            ''')
+            for player in players
+        ]
+        
+        try:
+            if conn is not None:
+                conn.executemany(UPSERT_PLAYER_SQL, rows)
+            else:
+                with self.transaction() as conn:
+                    conn.executemany(UPSERT_PLAYER_SQL, rows)
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Invalid player data: {e}") from e
+        
+        # Callers log their own summary; keep the per-write message at DEBUG and only
+        # format it when DEBUG is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Saved %s players", len(rows))
+        return len(rows)
+    
+    def upsert_games(self, games: List[Dict[str, Any]],
+                     conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Insert or update multiple games in a single transaction.
+        
+        Games that already exist keep their teams and get the new date, time and venue.
+        
+        Args:
+            games: List of game dictionaries
+            conn: Connection from an open transaction(); the upsert then joins it
+                and is committed with it instead of on its own
             
-            conn.commit()
-            logger.info("Database tables initialized successfully")
\ No newline at end of file
+        Returns:
+            Number of games saved
+        """
+        rows = [
+            (
+                game.get('game_id'),
+                game.get('home_team'),
+                game.get('away_team'),
+                game.get('game_date'),
+                game.get('game_time'),
+                game.get('venue')
+            )
+            for game in games
+        ]
+        
+        # Other required fields are left to the NOT NULL constraints, but SQLite
+        # accepts NULL in a TEXT primary key, so a missing game_id is checked here
+        if any(row[0] is None for row in rows):
+            raise ValueError("Invalid game data: missing game_id")
+        
+        try:
+            if conn is not None:
+                conn.executemany(UPSERT_GAME_SQL, rows)
+            else:
+                with self.transaction() as conn:
+                    conn.executemany(UPSERT_GAME_SQL, rows)
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Invalid game data: {e}") from e
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Saved %s games", len(rows))
+        return len(rows)
@@ -292,25 +292,22 @@ class NBAApiScraper:
         """
         saved_count = 0
         
-        for game in games:
-            try:
-                # Check if game already exists
-                existing_game = self.db.get_game(game['game_id'])
-                
-                if existing_game:
-                    # Update existing game
-                    self.db.update_game(game['game_id'], game)
-                    logger.info(f"Updated game: {game['game_id']}")
-                else:
-                    # Insert new game
-                    self.db.insert_game(game)
-                    logger.info(f"Inserted game: {game['game_id']}")
-                
-                saved_count += 1
-                
-            except Exception as e:
-                logger.error(f"Error saving game {game.get('game_id', 'unknown')}: {str(e)}")
-                continue
+        try:
+            # Insert new games and update existing ones in one batch
+            saved_count = self.db.upsert_games(games)
+            
+        except ValueError as e:
+            # A bad game fails the whole batch; save the games one at a time so
+            # only the bad ones are skipped
+            logger.warning(f"Batch save failed ({str(e)}), saving games individually")
+            for game in games:
+                try:
+                    saved_count += self.db.upsert_games([game])
+                except Exception as e:
+                    logger.error(f"Error saving game {game.get('game_id', 'unknown')}: {str(e)}")
+            
+        except Exception as e:
+            logger.error(f"Error saving games: {str(e)}")
         
         logger.info(f"Saved {saved_count} games to database")
         return saved_count
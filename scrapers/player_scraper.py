@@ -557,74 +557,81 @@ class RotowireScraper:
         """
         saved_count = 0
         
+        # Process players from lineups and injury reports for the whole slate,
+        # skipping any game whose scraped data is incomplete
+        valid_games = []
+        game_players = []
         for game in games:
             try:
-                # Check if game already exists
-                existing_game = self.db.get_game(game['game_id'])
-                
-                if existing_game:
-                    # Update existing game
-                    self.db.update_game(game['game_id'], {
-                        'game_date': game['game_date'],
-                        'game_time': game['game_time'],
-                        'venue': game['venue']
-                    })
-                    logger.info(f"Updated game: {game['game_id']}")
-                else:
-                    # Insert new game
-                    game_data = {
-                        'game_id': game['game_id'],
-                        'home_team': game['home_team'],
-                        'away_team': game['away_team'],
-                        'game_date': game['game_date'],
-                        'game_time': game['game_time'],
-                        'venue': game['venue']
-                    }
-                    self.db.insert_game(game_data)
-                    logger.info(f"Inserted game: {game['game_id']}")
-                
-                # Process players from lineups
-                self._process_players(game['home_team'], game['home_lineup'], game['game_id'])
-                self._process_players(game['away_team'], game['away_lineup'], game['game_id'])
-                
-                # Process injured players
-                self._process_players(game['home_team'], game['home_injuries'], game['game_id'])
-                self._process_players(game['away_team'], game['away_injuries'], game['game_id'])
-                
-                saved_count += 1
-                
+                players = (
+                    self._process_players(game['home_team'], game['home_lineup'], game['game_id'])
+                    + self._process_players(game['away_team'], game['away_lineup'], game['game_id'])
+                    + self._process_players(game['home_team'], game['home_injuries'], game['game_id'])
+                    + self._process_players(game['away_team'], game['away_injuries'], game['game_id'])
+                )
             except Exception as e:
-                logger.error(f"Error saving game {game.get('game_id', 'unknown')}: {str(e)}")
+                logger.error(f"Error processing game {game.get('game_id', 'unknown')}: {str(e)}")
                 continue
+            
+            valid_games.append(game)
+            game_players.append(players)
+        
+        try:
+            # Save games and their players together in one transaction
+            with self.db.transaction() as conn:
+                self.db.upsert_games(valid_games, conn=conn)
+                self.db.insert_players([p for players in game_players for p in players], conn=conn)
+            
+            saved_count = len(valid_games)
+            
+        except ValueError as e:
+            # A bad row fails the whole batch; save each game with its players in its
+            # own transaction so only the bad games are skipped
+            logger.warning(f"Batch save failed ({str(e)}), saving games individually")
+            for game, players in zip(valid_games, game_players):
+                try:
+                    with self.db.transaction() as conn:
+                        self.db.upsert_games([game], conn=conn)
+                        self.db.insert_players(players, conn=conn)
+                    saved_count += 1
+                except Exception as e:
+                    logger.error(f"Error saving game {game.get('game_id', 'unknown')}: {str(e)}")
+            
+        except Exception as e:
+            logger.error(f"Error saving lineups: {str(e)}")
         
         logger.info(f"Saved {saved_count} games to database")
         return saved_count
     
-    def _process_players(self, team: str, players: List[Dict[str, Any]], game_id: str) -> None:
+    def _process_players(self, team: str, players: List[Dict[str, Any]], game_id: str) -> List[Dict[str, Any]]:
         """
-        Process and save players to the database.
+        Build database records for a team's players.
         
         Args:
             team: Team name
             players: List of player dictionaries
             game_id: Game ID for linking players to games
+            
+        Returns:
+            List of player dictionaries ready for Database.insert_players
         """
+        player_records = []
+        
         for player in players:
             try:
                 # Create player data for database
-                player_data = {
+                player_records.append({
                     'name': player['name'],
                     'team': team,
                     'position': player.get('position', ''),
                     'status': player.get('status', 'active'),
                     'game_id': game_id
-                }
-                
-                # Insert player
-                self.db.insert_player(player_data)
+                })
                 
             except Exception as e:
-                logger.error(f"Error saving player {player.get('name', 'unknown')}: {str(e)}")
+                logger.error(f"Error processing player {player.get('name', 'unknown')}: {str(e)}")
+        
+        return player_records
     
     def scrape_and_save_lineups(self, date_type: str = 'today') -> int:
         """